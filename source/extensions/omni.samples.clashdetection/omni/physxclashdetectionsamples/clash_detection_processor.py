@@ -10,7 +10,13 @@
 
 import omni.client
 import os
-from pxr import Usd, UsdUtils, Sdf
+import sys
+import time
+import concurrent.futures
+import functools
+import math
+import urllib.parse
+from pxr import Usd, UsdUtils, UsdGeom, Sdf, Gf
 from omni.physxclashdetectioncore.clash_query import ClashQuery
 from omni.physxclashdetectioncore.clash_data import ClashData
 from omni.physxclashdetectioncore.clash_info import ClashInfo
@@ -22,6 +28,81 @@ from omni.physxclashdetectioncore.utils import OptimizedProgressUpdate
 from omni.physxclashdetectionbake import ClashDetectionBake
 
 
+_PROGRESS_PRINT_INTERVAL = 1.0 / 30.0  # minimal time in seconds between two console progress updates
+
+_EXPORT_COLUMN_DEFS = [
+    ExportColumnDef(0, "Clash ID"),
+    ExportColumnDef(1, "Min Distance", True),
+    ExportColumnDef(2, "Tolerance", True),
+    ExportColumnDef(3, "Overlap Tris", True),
+    ExportColumnDef(4, "Clash Start"),
+    ExportColumnDef(5, "Clash End"),
+    ExportColumnDef(6, "Records", True),
+    ExportColumnDef(7, "Object A"),
+    ExportColumnDef(8, "Object B"),
+    ExportColumnDef(9, "Comment"),
+]
+
+_MAX_BOUNDS_CHECK_FRAMES = 240  # dynamic queries spanning more frames skip the searchset bounds check
+
+_REMOTE_URL_SCHEMES = ("omniverse", "http", "https")  # URL schemes normalized by omni.client, not resolved as local paths
+
+
+@functools.lru_cache(maxsize=256)
+def _relative_path(path: str, start_dir: str) -> str:
+    """
+    Memoized os.path.relpath, batch runs resolve the same layer against the same root repeatedly.
+    Normalized paths located under start_dir are resolved by trimming the prefix without going through os.path.
+    """
+    prefix = start_dir + os.sep
+    if path.startswith(prefix):
+        rel_path = path[len(prefix):]
+        if all(part not in ("", ".", "..") for part in rel_path.split(os.sep)):
+            return rel_path
+    return os.path.relpath(path, start_dir)
+
+
+def _stage_location_key(stage_path_name: str) -> str:
+    """
+    Returns a key identifying the stage file regardless of how its path is spelled (relative, with '..', casing on
+    case-insensitive file systems, file: URL). Remote URLs such as Nucleus paths are normalized by omni.client instead.
+    """
+    url = omni.client.break_url(stage_path_name)
+    if url.scheme == "file":
+        # file: URL paths are percent-encoded and Windows drive paths are written as '/C:/...'
+        path = urllib.parse.unquote(url.path or "")
+        if len(path) > 2 and path[0] == "/" and path[2] == ":" and path[1].isalpha():
+            path = path[1:]
+    elif url.scheme in _REMOTE_URL_SCHEMES:
+        return omni.client.normalize_url(stage_path_name)
+    else:
+        path = stage_path_name
+    return os.path.normcase(os.path.realpath(path))
+
+
+def _run_concurrently(fn, arg_tuples: list) -> list:
+    """
+    Calls fn once per argument tuple, each call on its own worker thread, and returns the results in order.
+    Meant for omni.client file operations, which are blocking round-trips for Nucleus URLs, so issuing them all at
+    once overlaps the waiting. Any exception raised by fn is re-raised.
+    """
+    if not arg_tuples:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(arg_tuples)) as executor:
+        futures = [executor.submit(fn, *args) for args in arg_tuples]
+        return [future.result() for future in futures]
+
+
+def _save_dirty_layers(stage: Usd.Stage):
+    """
+    Saves modified layers of the stage root layer stack (session layers excluded).
+    Unlike Usd.Stage.Save, layers from references and payloads are not visited as processing never edits them.
+    """
+    for layer in stage.GetLayerStack(includeSessionLayers=False):
+        if layer.dirty and not layer.anonymous:
+            layer.Save()
+
+
 class ClashDetectionProcessor:
     """
     This class is designed to perform clash detection on 3D models using the USD (Universal Scene Description) framework.
@@ -45,6 +126,8 @@ class ClashDetectionProcessor:
         query_name: str = '',
         comment: str = '',
         search_for_duplicates: bool = False,
+        keep_stage_open: bool = False,
+        skip_separated_searchsets: bool = False,
     ):
         """
         Parameters:
@@ -64,6 +147,8 @@ class ClashDetectionProcessor:
         query_name: str - custom name for the clash detection query which will be generated based on parameters above.
         comment: str - custom comment for the clash detection query which will be generated based on parameters above.
         search_for_duplicates: True to search for static identical meshes with identical transformations (fully overlapping each other). Overrules dynamic setting.
+        keep_stage_open: bool - True to keep the stage and clash data open after run() so that a following clean_up() can reuse them. Call close() to release them.
+        skip_separated_searchsets: bool - True to skip the clash detection engine when searchset A and B bounds are further apart than the tolerance. The bounds are computed by UsdGeom.BBoxCache and may not cover exactly the same geometry as the engine scope. Static queries walk both searchset subtrees to detect time varying transforms and extents. Dynamic queries evaluate bounds at whole frames only, so motion between frames (e.g. a rotation sweep) is not covered, and queries spanning more than _MAX_BOUNDS_CHECK_FRAMES frames always run the engine.
         """
         self._stage_path_name = stage_path_name
         self._html_path_name = html_path_name
@@ -86,29 +171,15 @@ class ClashDetectionProcessor:
             comment=comment
         )
         self._new_clash_data_layer_path_name = ''  # path to the new clash data layer if new one was created
-
-    def _export(self, clash_data: ClashData, num_overlaps_chk: int) -> bool:
-        """
-        Realizes the clash data export to HTML and JSON.
-        Returns: True on success, False otherwise.
-        """
-        column_defs = [
-            ExportColumnDef(0, "Clash ID"),
-            ExportColumnDef(1, "Min Distance", True),
-            ExportColumnDef(2, "Tolerance", True),
-            ExportColumnDef(3, "Overlap Tris", True),
-            ExportColumnDef(4, "Clash Start"),
-            ExportColumnDef(5, "Clash End"),
-            ExportColumnDef(6, "Records", True),
-            ExportColumnDef(7, "Object A"),
-            ExportColumnDef(8, "Object B"),
-            ExportColumnDef(9, "Comment"),
-        ]
-
-        overlaps = clash_data.find_all_overlaps_by_query_id(self._query.identifier, False)
-        if len(overlaps) != num_overlaps_chk:
-            print("Serialization issue detected.")
-        rows = [
+        self._keep_stage_open = keep_stage_open
+        self._skip_separated_searchsets = skip_separated_searchsets
+        self._stage = None  # stage kept open by run() when keep_stage_open is requested
+        self._clash_data = None  # clash data kept open by run() when keep_stage_open is requested
+
+    @staticmethod
+    def _build_export_rows(overlaps: dict) -> list:
+        """Formats overlaps into rows for the HTML and JSON exporters."""
+        return [
             [
                 o.overlap_id,
                 f"{o.min_distance:.3f}",
@@ -124,29 +195,131 @@ class ClashDetectionProcessor:
             for o in overlaps.values()
         ]
 
+    def _export(self, clash_data: ClashData, num_overlaps_chk: int) -> bool:
+        """
+        Realizes the clash data export to HTML and JSON.
+        Returns: True on success, False otherwise.
+        """
+        if num_overlaps_chk == 0:
+            rows = []  # nothing was detected, no need to query the clash data
+        else:
+            overlaps = clash_data.find_all_overlaps_by_query_id(self._query.identifier, False)
+            if len(overlaps) != num_overlaps_chk:
+                print("Serialization issue detected.")
+            rows = self._build_export_rows(overlaps)
+            del overlaps  # rows hold everything needed for the export, don't keep both alive while serializing
+
+        # Serialization is Python code holding the GIL, so formats are serialized one after the other on this thread,
+        # only the writes are issued concurrently.
+        payloads = []  # (file type, path name, bytes) triples
         if self._html_path_name:
             print(f"Exporting to HTML file '{self._html_path_name}'...")
-            html_bytes = export_to_html("Clash Detection Results", self._stage_path_name, column_defs, rows)
+            html_bytes = export_to_html("Clash Detection Results", self._stage_path_name, _EXPORT_COLUMN_DEFS, rows)
             if not html_bytes or len(html_bytes) == 0:
                 print("HTML export failed.")
                 return False
-            if omni.client.write_file(self._html_path_name, html_bytes) != omni.client.Result.OK:
-                print(f"Failed writing HTML file to '{self._html_path_name}'.")
-                return False
-            html_bytes = None
+            payloads.append(("HTML", self._html_path_name, html_bytes))
+            del html_bytes
 
         if self._json_path_name:
             print(f"Exporting to JSON file '{self._json_path_name}'...")
-            json_bytes = export_to_json(column_defs, rows)
+            json_bytes = export_to_json(_EXPORT_COLUMN_DEFS, rows)
             if not json_bytes or len(json_bytes) == 0:
                 print("JSON export failed.")
                 return False
-            if omni.client.write_file(self._json_path_name, json_bytes) != omni.client.Result.OK:
-                print(f"Failed writing JSON file to '{self._json_path_name}'.")
-                return False
-            json_bytes = None
+            payloads.append(("JSON", self._json_path_name, json_bytes))
+            del json_bytes
 
-        return True
+        del rows  # both formats are serialized, only the payloads need memory from now on
+        results = _run_concurrently(omni.client.write_file, [(path_name, data) for _, path_name, data in payloads])
+        r = True
+        for (file_type, path_name, _), result in zip(payloads, results):
+            if result != omni.client.Result.OK:
+                print(f"Failed writing {file_type} file to '{path_name}'.")
+                r = False
+
+        return r
+
+    def _are_searchsets_separated(self, stage: Usd.Stage) -> bool:
+        """
+        Cheap broad phase check before running the clash detection engine.
+        Returns True if world space bounds of searchsets A and B are further apart than the tolerance, so no clash can
+        be found. Conservatively returns False whenever the check does not apply: searchsets that are not plain prim
+        paths (whole stage, collections), duplicate searches and static queries with transforms or extents that might
+        vary over time.
+        NOTE: bounds come from UsdGeom.BBoxCache, which relies on authored extents rather than on mesh points, so the
+        geometry considered here may differ from the one the clash detection engine scope collects. Invisible prims
+        are included.
+        """
+        settings = self._query.clash_detect_settings
+        if settings.get(SettingId.SETTING_DUP_MESHES.name, False):
+            return False
+
+        prims = []
+        for path in (self._query.object_a_path, self._query.object_b_path):
+            if not path or not Sdf.Path.IsValidPathString(path):
+                return False
+            sdf_path = Sdf.Path(path)
+            if not sdf_path.IsPrimPath():
+                return False
+            prim = stage.GetPrimAtPath(sdf_path)
+            if not prim:
+                return False
+            prims.append(prim)
+
+        if settings.get(SettingId.SETTING_DYNAMIC.name, False):
+            # union of bounds over all frames of the queried time range
+            time_codes_per_second = stage.GetTimeCodesPerSecond()
+            start_time_code = settings.get(SettingId.SETTING_DYNAMIC_START_TIME.name, 0.0) * time_codes_per_second
+            end_time_code = settings.get(SettingId.SETTING_DYNAMIC_END_TIME.name, 0.0) * time_codes_per_second
+            if end_time_code <= start_time_code:
+                return False
+            if math.ceil(end_time_code) - math.floor(start_time_code) + 1 > _MAX_BOUNDS_CHECK_FRAMES:
+                return False  # sampling bounds over that many frames would cost more than the check saves
+            time_codes = [Usd.TimeCode(t) for t in range(math.floor(start_time_code), math.ceil(end_time_code) + 1)]
+        else:
+            # the time evaluated by the engine is not known here, only static bounds can be trusted
+            if any(self._might_bounds_vary_over_time(prim) for prim in prims):
+                return False
+            time_codes = [Usd.TimeCode.Default()]
+
+        purposes = [UsdGeom.Tokens.default_, UsdGeom.Tokens.render, UsdGeom.Tokens.proxy, UsdGeom.Tokens.guide]
+        bbox_cache = UsdGeom.BBoxCache(time_codes[0], purposes, useExtentsHint=False, ignoreVisibility=True)
+        ranges = [Gf.Range3d(), Gf.Range3d()]
+        for time_code in time_codes:
+            bbox_cache.SetTime(time_code)
+            for prim, prim_range in zip(prims, ranges):
+                prim_range.UnionWith(bbox_cache.ComputeWorldBound(prim).ComputeAlignedRange())
+
+        range_a, range_b = ranges
+        if range_a.IsEmpty() or range_b.IsEmpty():
+            return False
+        min_a, max_a = range_a.GetMin(), range_a.GetMax()
+        min_b, max_b = range_b.GetMin(), range_b.GetMax()
+        distance_sq = sum(max(0.0, min_a[i] - max_b[i], min_b[i] - max_a[i]) ** 2 for i in range(3))
+        tolerance = settings.get(SettingId.SETTING_TOLERANCE.name, 0.0)
+        return distance_sq > tolerance * tolerance
+
+    @staticmethod
+    def _might_bounds_vary_over_time(prim: Usd.Prim) -> bool:
+        """
+        Returns True if a transform on the prim, its ancestors or descendants, or an extent under the prim might be
+        time varying.
+        """
+        parent = prim.GetParent()
+        while parent:
+            xformable = UsdGeom.Xformable(parent)
+            if xformable and xformable.TransformMightBeTimeVarying():
+                return True
+            parent = parent.GetParent()
+        for descendant in Usd.PrimRange(prim, Usd.TraverseInstanceProxies()):
+            xformable = UsdGeom.Xformable(descendant)
+            if xformable and xformable.TransformMightBeTimeVarying():
+                return True
+            boundable = UsdGeom.Boundable(descendant)
+            if boundable and boundable.GetExtentAttr().ValueMightBeTimeVarying():
+                return True
+        return False
 
     def _detect_overlaps(self, stage: Usd.Stage, clash_detect: ClashDetection, clash_data: ClashData) -> int:
         """
@@ -155,42 +328,69 @@ class ClashDetectionProcessor:
         """
         print("Running clash detection engine...", end="")
         progress_update = OptimizedProgressUpdate()
+        last_print_time = 0.0
         num_steps = clash_detect.create_pipeline()
         for i in range(num_steps):
             step_data = clash_detect.get_pipeline_step_data(i)
             if step_data.finished:
                 break
             if progress_update.update(step_data.progress):
-                print(".", end="")
+                now = time.monotonic()
+                if now - last_print_time >= _PROGRESS_PRINT_INTERVAL:
+                    sys.stdout.write(".")
+                    sys.stdout.flush()
+                    last_print_time = now
             clash_detect.run_pipeline_step(i)
         print("Finished.")
 
         num_overlaps = clash_detect.get_nb_overlaps()
         print(f"Fetching {num_overlaps} overlaps...", end="")
         for p in clash_detect.fetch_and_save_overlaps(stage, clash_data, self._query):
-            print(".", end="")
+            sys.stdout.write(".")
+        sys.stdout.flush()
         print("Finished.")
 
         return num_overlaps
 
-    def _clean_overlaps_and_query(self) -> bool:
+    def _open_stage_and_clash_data(self):
         """
-        Cleans up the overlaps and queries from the clash data, ensuring a fresh state for new clash detection runs.
-        Returns: True if the cleanup was successful, False otherwise.
+        Opens the stage and its clash data, reusing the ones kept open by a previous run if there are any.
+        Returns: (stage, clash_data) on success, (None, None) otherwise.
         """
+        if self._stage:
+            return self._stage, self._clash_data
         stage_path_name = self._stage_path_name
         if not stage_path_name:
             print("Stage name to process was not provided.")
-            return False
+            return None, None
         print(f"Opening stage '{stage_path_name}'...")
         stage = Usd.Stage.Open(stage_path_name)
         if not stage:
             print(f"Failed to open stage '{stage_path_name}'")
-            return False
-        UsdUtils.StageCache.Get().Insert(stage)
+            return None, None
+        stage_cache = UsdUtils.StageCache.Get()
+        stage_cache.Insert(stage)
 
         clash_data = ClashData(ClashDataSerializerSqlite())
-        clash_data.open(UsdUtils.StageCache.Get().GetId(stage).ToLongInt(), True)
+        clash_data.open(stage_cache.GetId(stage).ToLongInt(), True)
+        return stage, clash_data
+
+    def _close_stage_and_clash_data(self, stage: Usd.Stage, clash_data: ClashData):
+        """Closes the clash data and releases the stage from the stage cache."""
+        clash_data.close()
+        clash_data.destroy()
+        UsdUtils.StageCache.Get().Erase(stage)
+        self._stage = None
+        self._clash_data = None
+
+    def _clean_overlaps_and_query(self) -> bool:
+        """
+        Cleans up the overlaps and queries from the clash data, ensuring a fresh state for new clash detection runs.
+        Returns: True if the cleanup was successful, False otherwise.
+        """
+        stage, clash_data = self._open_stage_and_clash_data()
+        if not stage:
+            return False
 
         affected_records = clash_data.remove_all_overlaps_by_query_id(self._query.identifier, False)
         print(f"{affected_records} clash {'record' if affected_records == 1 else 'records'} removed.")
@@ -199,15 +399,19 @@ class ClashDetectionProcessor:
         self._query._identifier = 0
 
         clash_data.save()
-        Usd.Stage.Save(stage)
+        _save_dirty_layers(stage)  # cleanup typically dirties only the clash data layer
         clash_data.saved()
-        clash_data.close()
-        clash_data.destroy()
-        UsdUtils.StageCache.Get().Erase(stage)
+        self._close_stage_and_clash_data(stage, clash_data)
 
         return True
 
-    def _generate_dynamic_clash_bake(self, stage : Usd.Stage, clash_data : ClashData):
+    def _generate_dynamic_clash_bake(
+        self,
+        stage: Usd.Stage,
+        clash_data: ClashData,
+        root_layer: Sdf.Layer,
+        session_layer: Sdf.Layer,
+    ):
         """Executes a simple baking of clash results for current query"""
         if self._clash_bake_meshes_layer_path == '' or self._clash_bake_meshes_material_path == '':
             raise Exception("Clash Bake Generation needs paths for meshes and materials layers")
@@ -216,15 +420,15 @@ class ClashDetectionProcessor:
         overlaps = clash_data.find_all_overlaps_by_query_id(clash_query_id=self._query.identifier, 
                                                             fetch_also_frame_info=True)
         
-        clash_infos = [clash_info for clash_info in overlaps.values()]
+        clash_infos = list(overlaps.values())
+        del overlaps
 
         # Collect all a/b paths
-        paths = [(str(ci.object_a_path), str(ci.object_b_path)) for ci in clash_infos]
+        paths = [(ci.object_a_path, ci.object_b_path) for ci in clash_infos]  # ClashInfo paths are already str
 
         # Prepare bake infos
         bake_infos = ClashDetectionBake.prepare_clash_bake_infos(stage=stage, clash_infos=clash_infos)
         # Open or create two dedicates layers for clash baking, one for materials and one for meshes
-        root_layer = stage.GetRootLayer()
         layer_meshes: Sdf.Layer = Sdf.Layer.CreateNew(self._clash_bake_meshes_layer_path)  # type: ignore
         layer_materials: Sdf.Layer = Sdf.Layer.CreateNew(self._clash_bake_meshes_material_path)  # type: ignore
 
@@ -236,16 +440,19 @@ class ClashDetectionProcessor:
         layer_materials.timeCodesPerSecond = root_layer.timeCodesPerSecond  # type: ignore
 
         # Insert layers into stage
-        session_layer = stage.GetSessionLayer()
         session_layer.subLayerPaths.append(layer_meshes.identifier)
         session_layer.subLayerPaths.append(layer_materials.identifier)
 
         # Copy Support files (material shaders mainly) to same folder where layers live
         support_paths = ClashDetectionBake.get_support_files_paths()
         dest_folder = os.path.dirname(str(layer_materials.identifier))
-        for src in support_paths:
-            dest = os.path.join(dest_folder, os.path.basename(src))
-            omni.client.copy(src, dest, omni.client.CopyBehavior.OVERWRITE)
+        copies = [
+            (src, os.path.join(dest_folder, os.path.basename(src)), omni.client.CopyBehavior.OVERWRITE)
+            for src in support_paths or []
+        ]
+        for (src, dest, _), result in zip(copies, _run_concurrently(omni.client.copy, copies)):
+            if result != omni.client.Result.OK:
+                print(f"Failed copying support file '{src}' to '{dest}': {result}.")
 
         old_edit_target = stage.GetEditTarget()
         try:
@@ -290,18 +497,10 @@ class ClashDetectionProcessor:
         Returns True if run was successful, False otherwise.
         """
         stage_path_name = self._stage_path_name
-        if not stage_path_name:
-            print("Stage name to process was not provided.")
-            return False
-        print(f"Opening stage '{stage_path_name}'...")
-        stage = Usd.Stage.Open(stage_path_name)
+        stage, clash_data = self._open_stage_and_clash_data()
         if not stage:
-            print(f"Failed to open stage '{stage_path_name}'")
             return False
-        UsdUtils.StageCache.Get().Insert(stage)
-
-        clash_data = ClashData(ClashDataSerializerSqlite())
-        clash_data.open(UsdUtils.StageCache.Get().GetId(stage).ToLongInt(), True)
+        root_layer = stage.GetRootLayer()
 
         print("Creating new query...")
         new_query_id = clash_data.insert_query(self._query, True, True)
@@ -313,37 +512,45 @@ class ClashDetectionProcessor:
         if clash_data._target_layer and clash_data._target_layer.anonymous:
             new_clash_data_layer = True
 
-        print("Setting up clash detection engine...")
-        clash_detect = ClashDetection()
-        if not clash_detect.set_settings(self._query.clash_detect_settings, stage):
-            print("Failed to set clash detection settings.")
-            return False
-        if not clash_detect.set_scope(
-            stage,
-            self._query.object_a_path,
-            self._query.object_b_path,
-            self._query.clash_detect_settings.get(SettingId.SETTING_DUP_MESHES.name, False)
-        ):
-            print("Failed to set clash detection scope.")
-            return False
+        if self._skip_separated_searchsets and self._are_searchsets_separated(stage):
+            print("Searchsets are further apart than tolerance, skipping clash detection engine.")
+            num_overlaps = 0
+        else:
+            print("Setting up clash detection engine...")
+            clash_detect = ClashDetection()
+            if not clash_detect.set_settings(self._query.clash_detect_settings, stage):
+                print("Failed to set clash detection settings.")
+                return False
+            if not clash_detect.set_scope(
+                stage,
+                self._query.object_a_path,
+                self._query.object_b_path,
+                self._query.clash_detect_settings.get(SettingId.SETTING_DUP_MESHES.name, False)
+            ):
+                print("Failed to set clash detection scope.")
+                return False
 
-        num_overlaps = self._detect_overlaps(stage, clash_detect, clash_data)
+            num_overlaps = self._detect_overlaps(stage, clash_detect, clash_data)
         if self._clash_bake:
             print(f"Generating Clash Bake Layers for '{stage_path_name}'...")
-            self._generate_dynamic_clash_bake(stage, clash_data)
+            self._generate_dynamic_clash_bake(stage, clash_data, root_layer, stage.GetSessionLayer())
 
         print(f"Saving stage '{stage_path_name}'...")
         if not clash_data.save():
             print("Failed to save clash detection results.")
         # now make sure, that the layer is referenced by relative path, not absolute
-        root_layer = stage.GetRootLayer()
-        for path in root_layer.subLayerPaths:
-            if path == clash_data._target_layer.identifier:
-                root_layer.subLayerPaths.remove(path)
-                rel_path = os.path.relpath(clash_data._target_layer.identifier, os.path.dirname(root_layer.identifier))
-                root_layer.subLayerPaths.append(rel_path)
-                break
-        Usd.Stage.Save(stage)
+        root_dir = os.path.dirname(root_layer.identifier)
+        target_layer_identifier = clash_data._target_layer.identifier
+        sub_layer_paths = root_layer.subLayerPaths
+        try:
+            idx = sub_layer_paths.index(target_layer_identifier)
+        except ValueError:
+            idx = -1
+        if idx >= 0:
+            # replace in place, a single lookup and a single edit instead of a scan followed by remove + append
+            rel_path = _relative_path(target_layer_identifier, root_dir)
+            sub_layer_paths[idx] = rel_path
+        _save_dirty_layers(stage)
         clash_data.saved()
 
         if new_clash_data_layer:
@@ -352,13 +559,44 @@ class ClashDetectionProcessor:
         if self._json_path_name or self._html_path_name:
             self._export(clash_data, num_overlaps)
 
-        print(f"Closing stage '{stage_path_name}'...")
-        UsdUtils.StageCache.Get().Erase(stage)
-        clash_data.close()
-        clash_data.destroy()
+        if self._keep_stage_open:
+            self._stage = stage
+            self._clash_data = clash_data
+        else:
+            print(f"Closing stage '{stage_path_name}'...")
+            self._close_stage_and_clash_data(stage, clash_data)
 
         return True
 
+    @staticmethod
+    def run_many(processors: list, max_workers: int = 0) -> list:
+        """
+        Performs the clash detection of several processors using a thread pool.
+        Only processors working on different stages run concurrently. Processors working on the same stage are run one
+        after another as they write into the same stage and clash data, so many queries on a single stage run fully
+        serially.
+        Parameters:
+        processors: list of ClashDetectionProcessor - processors to run.
+        max_workers: int - maximum number of worker threads, zero to use the thread pool default.
+        Returns list of run() results in the same order as processors.
+        """
+        stage_groups = {}
+        for idx, processor in enumerate(processors):
+            stage_groups.setdefault(_stage_location_key(processor._stage_path_name), []).append(idx)
+
+        results = [False] * len(processors)
+
+        def run_stage_group(indices: list):
+            for idx in indices:
+                results[idx] = processors[idx].run()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or None) as executor:
+            futures = [executor.submit(run_stage_group, indices) for indices in stage_groups.values()]
+            for future in futures:
+                future.result()
+
+        return results
+
     def clean_up(self) -> bool:
         """
         Cleans up the overlaps and queries from the clash data, ensuring a fresh state for new clash detection runs.
@@ -366,23 +604,34 @@ class ClashDetectionProcessor:
         Returns: True if the cleanup was successful, False otherwise.
         """
         r = True
+        deletions = []  # (path, description) pairs
         if self._json_path_name:
-            if omni.client.delete(self._json_path_name) == omni.client.Result.OK:
-                print(f"Exported file '{self._json_path_name}' deleted.")
-            else:
-                r = False
+            deletions.append((self._json_path_name, "Exported file"))
         if self._html_path_name:
-            if omni.client.delete(self._html_path_name) == omni.client.Result.OK:
-                print(f"Exported file '{self._html_path_name}' deleted.")
-            else:
-                r = False
+            deletions.append((self._html_path_name, "Exported file"))
         if self._new_clash_data_layer_path_name:
-            if omni.client.delete(self._new_clash_data_layer_path_name) == omni.client.Result.OK:
-                print(f"Created layer '{self._new_clash_data_layer_path_name}' deleted.")
+            self.close()  # the layer must not be in use when deleted
+            deletions.append((self._new_clash_data_layer_path_name, "Created layer"))
+
+        results = _run_concurrently(omni.client.delete, [(path,) for path, _ in deletions])
+        for (path, description), result in zip(deletions, results):
+            if result == omni.client.Result.OK:
+                print(f"{description} '{path}' deleted.")
             else:
                 r = False
+
+        if self._new_clash_data_layer_path_name:
             self._new_clash_data_layer_path_name = ''
         else:
             if not self._clean_overlaps_and_query():
                 r = False
         return r
+
+    def close(self):
+        """
+        Releases the stage and clash data kept open by run() when keep_stage_open was requested.
+        Does nothing if there is nothing kept open.
+        """
+        if self._stage:
+            print(f"Closing stage '{self._stage_path_name}'...")
+            self._close_stage_and_clash_data(self._stage, self._clash_data)
@@ -12,10 +12,50 @@ import os
 import tempfile
 import pathlib
 import asyncio
+import traceback
+import concurrent.futures
+from functools import partial
+import carb
 import omni.ui as ui
-import omni.client
 
-from .clash_detection_processor import ClashDetectionProcessor
+_startfile = getattr(os, "startfile", None)  # only available on Windows
+
+# ClashDetectionProcessor parameters of the provided samples
+_STATIC_SAMPLE = dict(
+    object_a_path="/Root/Xform_Primitives/Cube",
+    object_b_path="/Root/Xform_Primitives/Plane",
+    logging=False,
+    query_name="Example Static Query",
+    comment="A static clash query designed to identify clash between gray block and the ground plane.",
+)
+_DYNAMIC_SAMPLE = dict(
+    object_a_path="/Root/STATION_TIME_SAMPLED",
+    object_b_path="/Root/Xform_Primitives",
+    tolerance=5,
+    dynamic=True,
+    start_time=3,
+    end_time=20,
+    logging=False,
+    query_name="Example Dynamic Query",
+    comment="A dynamic clash query designed to identify instances where the yellow platform's animation collides with the gray block, starting from the 3-second mark and concluding at 20 seconds.",
+)
+_DUPS_SAMPLE = dict(
+    query_name="Example Search for Duplicates Query",
+    comment="A static clash query designed to identify identical meshes with identical transformations fully overlapping each other.",
+    search_for_duplicates=True,
+)
+_CLASH_BAKE_DYNAMIC_SAMPLE = dict(
+    object_a_path="/Root/STATION_TIME_SAMPLED",
+    object_b_path="/Root/Xform_Primitives",
+    tolerance=5,
+    dynamic=True,
+    start_time=0,
+    end_time=15,
+    logging=False,
+    clash_bake=True,
+    query_name="Clash Bake Dynamic Query",
+    comment="A dynamic clash query designed to generate data to be baked using Clash Layer Bake API.",
+)
 
 
 class ClashDetectionSamplesWindow(ui.Window):
@@ -25,76 +65,119 @@ class ClashDetectionSamplesWindow(ui.Window):
         super().__init__(self.WINDOW_NAME, width=700, height=300, visible=True)
 
         self._test_data_path = test_data_path
-        self._stage_path_name = str(pathlib.Path(self._test_data_path).joinpath("time_sampled.usda"))
-        self._temp_dir_path = tempfile.TemporaryDirectory().name
-
-        self.frame.set_build_fn(self.build_window)
+        self._stage_path_name = str(pathlib.Path(self._test_data_path) / "time_sampled.usda")
+        # temporary directory for sample outputs is created on first sample run
+        self._temp_dir_ctx = None
+        self._temp_dir_path = ''
+        self._temp_dir = None
+        self._export_path_names_cache = {}  # sample name -> (html path name, json path name)
+        # samples run off the UI thread; they all share the sample stage, so they are run one at a time
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_run = None  # future of the sample currently running on the executor
+        self._destroyed = False
+        self._stage_buttons = []  # buttons accessing the sample stage, disabled while a sample runs
+
+        # the layout is static, build it once instead of on every frame invalidation
+        self.build_window()
+
+    def destroy(self):
+        self._destroyed = True
+        self._executor.shutdown(wait=False)
+        self._stage_buttons = []
+        if self._temp_dir_ctx:
+            temp_dir_ctx = self._temp_dir_ctx
+            self._temp_dir_ctx = None
+            self._export_path_names_cache = {}
+            if self._pending_run:
+                # a running sample still writes into the temp directory, remove it once the run completes
+                self._pending_run.add_done_callback(lambda _: temp_dir_ctx.cleanup())
+            else:
+                temp_dir_ctx.cleanup()
+        super().destroy()
 
     def destroy_window(self):
         self.undock()
         self.visible = False
-        super().destroy()
-
-    def _run_clash_processor_on_sample_stage_static(self):
-        html_path_name = str(pathlib.Path(self._temp_dir_path).joinpath("static_sample_export.html"))
-        json_path_name = str(pathlib.Path(self._temp_dir_path).joinpath("static_sample_export.json"))
-
-        cdp = ClashDetectionProcessor(
-            stage_path_name=self._stage_path_name,
-            object_a_path="/Root/Xform_Primitives/Cube",
-            object_b_path="/Root/Xform_Primitives/Plane",
-            logging=False,
-            html_path_name=html_path_name,
-            json_path_name=json_path_name,
-            query_name="Example Static Query",
-            comment="A static clash query designed to identify clash between gray block and the ground plane."
-        )
-        cdp.run()
-
-        if hasattr(os, 'startfile'):
-            os.startfile(self._temp_dir_path)
-
-    def _run_clash_processor_on_sample_stage_dynamic(self):
-        html_path_name = str(pathlib.Path(self._temp_dir_path).joinpath("dynamic_sample_export.html"))
-        json_path_name = str(pathlib.Path(self._temp_dir_path).joinpath("dynamic_sample_export.json"))
-
-        cdp = ClashDetectionProcessor(
-            stage_path_name=self._stage_path_name,
-            object_a_path="/Root/STATION_TIME_SAMPLED",
-            object_b_path="/Root/Xform_Primitives",
-            tolerance=5,
-            dynamic=True,
-            start_time=3,
-            end_time=20,
-            logging=False,
-            html_path_name=html_path_name,
-            json_path_name=json_path_name,
-            query_name="Example Dynamic Query",
-            comment="A dynamic clash query designed to identify instances where the yellow platform's animation collides with the gray block, starting from the 3-second mark and concluding at 20 seconds."
-        )
-        cdp.run()
-
-        if hasattr(os, "startfile"):
-            os.startfile(self._temp_dir_path)
-
-    def _run_clash_processor_on_sample_stage_dups(self):
-        html_path_name = str(pathlib.Path(self._temp_dir_path).joinpath("dups_sample_export.html"))
-        json_path_name = str(pathlib.Path(self._temp_dir_path).joinpath("dups_sample_export.json"))
-
+        self.destroy()
+
+    def _ensure_temp_dir(self):
+        if self._temp_dir_ctx is None:
+            # keep the TemporaryDirectory object alive, its finalizer removes the directory
+            self._temp_dir_ctx = tempfile.TemporaryDirectory()
+            self._temp_dir_path = self._temp_dir_ctx.name
+            self._temp_dir = pathlib.Path(self._temp_dir_path)
+
+    def _export_path_names(self, sample_name: str) -> tuple:
+        """Returns (html path name, json path name) of sample exports, composed once per sample."""
+        path_names = self._export_path_names_cache.get(sample_name)
+        if path_names is None:
+            self._ensure_temp_dir()
+            export_path = self._temp_dir / f"{sample_name}_sample_export"
+            path_names = (str(export_path.with_suffix(".html")), str(export_path.with_suffix(".json")))
+            self._export_path_names_cache[sample_name] = path_names
+        return path_names
+
+    def _run_async(self, job, on_done):
+        """
+        Runs the job off the UI thread, then calls on_done back on the UI thread.
+        Nothing is called back if the job failed or the window was destroyed in the meantime.
+        NOTE: ClashDetection and ClashDetectionBake are assumed to be safe to use off the main thread.
+        """
+        if self._is_sample_stage_open():
+            # the worker would edit and save layers shared with the stage Hydra and the UI read on the main thread
+            carb.log_warn("The sample stage is open, close it before running the samples.")
+            return
+
+        async def run_async():
+            if self._destroyed:
+                return
+            # samples and opening the sample stage are serialized, keep the stage buttons disabled until this run finishes
+            for button in self._stage_buttons:
+                button.enabled = False
+            self._pending_run = self._executor.submit(job)
+            try:
+                await asyncio.wrap_future(self._pending_run)
+            except Exception as e:
+                carb.log_error(f"Clash detection sample failed: {e}\n{traceback.format_exc()}")
+                return
+            finally:
+                self._pending_run = None
+                if not self._destroyed:
+                    for button in self._stage_buttons:
+                        button.enabled = True
+            if not self._destroyed:
+                on_done()
+        asyncio.ensure_future(run_async())
+
+    def _is_sample_stage_open(self) -> bool:
+        """Returns True if the sample stage root layer is used by the stage opened in the UsdContext."""
+        import omni.usd
+        from pxr import Sdf
+        stage = omni.usd.get_context().get_stage()
+        if not stage:
+            return False
+        layer = Sdf.Layer.Find(self._stage_path_name)
+        return bool(layer) and layer in stage.GetUsedLayers()
+
+    def _open_temp_dir(self):
+        if _startfile:
+            _startfile(self._temp_dir_path)
+
+    def _run_sample(self, sample_name: str, **cdp_kwargs):
+        """Runs a sample processor on the sample stage exporting results to the temp directory."""
+        from .clash_detection_processor import ClashDetectionProcessor
+        html_path_name, json_path_name = self._export_path_names(sample_name)
         cdp = ClashDetectionProcessor(
             stage_path_name=self._stage_path_name,
             html_path_name=html_path_name,
             json_path_name=json_path_name,
-            query_name="Example Search for Duplicates Query",
-            comment="A static clash query designed to identify identical meshes with identical transformations fully overlapping each other.",
-            search_for_duplicates=True
+            **cdp_kwargs
         )
-        cdp.run()
-
-        if hasattr(os, 'startfile'):
-            os.startfile(self._temp_dir_path)
+        self._run_async(cdp.run, self._open_temp_dir)
 
     def _run_clash_bake_on_sample_stage_dynamic(self):
+        from .clash_detection_processor import ClashDetectionProcessor
+        self._ensure_temp_dir()
         extension = "usd"
         temp_path = f"{self._temp_dir_path}/BaseStage"
         layer_meshes_path = temp_path + f"Over_CLASH_MESHES.{extension}"
@@ -102,26 +185,17 @@ class ClashDetectionSamplesWindow(ui.Window):
 
         cdp = ClashDetectionProcessor(
             stage_path_name=self._stage_path_name,
-            object_a_path="/Root/STATION_TIME_SAMPLED",
-            object_b_path="/Root/Xform_Primitives",
-            tolerance=5,
-            dynamic=True,
-            start_time=0,
-            end_time=15,
-            logging=False,
-            clash_bake=True,
             clash_bake_meshes_layer_path=layer_meshes_path,
             clash_bake_meshes_material_path=layer_materials_path,
-            query_name="Clash Bake Dynamic Query",
-            comment="A dynamic clash query designed to generate data to be baked using Clash Layer Bake API.",
+            **_CLASH_BAKE_DYNAMIC_SAMPLE
         )
-        cdp.run()
-
-        # For testing purposes only, copy the baked stage to the temp directory, so it can be easily composed
-        omni.client.copy(self._stage_path_name, f"{self._temp_dir_path}/{os.path.basename(self._stage_path_name)}")
 
-        if hasattr(os, "startfile"):
-            os.startfile(self._temp_dir_path)
+        def run_and_copy():
+            import omni.client
+            cdp.run()
+            # For testing purposes only, copy the baked stage to the temp directory, so it can be easily composed
+            omni.client.copy(self._stage_path_name, f"{self._temp_dir_path}/{os.path.basename(self._stage_path_name)}")
+        self._run_async(run_and_copy, self._open_temp_dir)
 
     def _open_sample_stage(self):
         async def open_sample_stage():
@@ -131,33 +205,38 @@ class ClashDetectionSamplesWindow(ui.Window):
         asyncio.ensure_future(open_sample_stage())
 
     def build_window(self):
+        samples = (
+            (
+                partial(self._run_sample, "dups", **_DUPS_SAMPLE),
+                "Execute Clash Processor configured to create and run a static query on the sample scene to identify identical meshes with identical transformations fully overlapping each other. Export results."
+            ),
+            (
+                partial(self._run_sample, "static", **_STATIC_SAMPLE),
+                "Execute Clash Processor configured to create and run a static query on the sample scene to identify a clash between gray block and the ground plane. Export results."
+            ),
+            (
+                partial(self._run_sample, "dynamic", **_DYNAMIC_SAMPLE),
+                "Execute Clash Processor configured to create and run a dynamic query on the sample scene to identify instances where the yellow platform's animation collides with the gray block. Export results."
+            ),
+            (
+                self._run_clash_bake_on_sample_stage_dynamic,
+                "Bake sample stage clashes to a new layer headlessly."
+            ),
+        )
+        self._stage_buttons = []
         with self.frame:
             with ui.VStack():
                 with ui.CollapsableFrame("Available Clash Detection Samples - Observe the console output, as there is no UI in use.", height=0):
                     with ui.VStack():
-                        with ui.HStack(height=0):
-                            ui.Spacer(width=5)
-                            ui.Button("Run", width=100, clicked_fn=self._run_clash_processor_on_sample_stage_dups)
-                            ui.Spacer(width=10)
-                            ui.Label("Execute Clash Processor configured to create and run a static query on the sample scene to identify identical meshes with identical transformations fully overlapping each other. Export results.")
-                        with ui.HStack(height=0):
-                            ui.Spacer(width=5)
-                            ui.Button("Run", width=100, clicked_fn=self._run_clash_processor_on_sample_stage_static)
-                            ui.Spacer(width=10)
-                            ui.Label("Execute Clash Processor configured to create and run a static query on the sample scene to identify a clash between gray block and the ground plane. Export results.")
-                        with ui.HStack(height=0):
-                            ui.Spacer(width=5)
-                            ui.Button("Run", width=100, clicked_fn=self._run_clash_processor_on_sample_stage_dynamic)
-                            ui.Spacer(width=10)
-                            ui.Label("Execute Clash Processor configured to create and run a dynamic query on the sample scene to identify instances where the yellow platform's animation collides with the gray block. Export results.")
-                        with ui.HStack(height=0):
-                            ui.Spacer(width=5)
-                            ui.Button("Run", width=100, clicked_fn=self._run_clash_bake_on_sample_stage_dynamic)
-                            ui.Spacer(width=10)
-                            ui.Label("Bake sample stage clashes to a new layer headlessly.")
+                        for run_fn, description in samples:
+                            with ui.HStack(height=0):
+                                ui.Spacer(width=5)
+                                self._stage_buttons.append(ui.Button("Run", width=100, clicked_fn=run_fn))
+                                ui.Spacer(width=10)
+                                ui.Label(description)
                 with ui.CollapsableFrame("Available Clash Detection Sample Stages:", height=0):
                     with ui.HStack(height=0):
                         ui.Spacer(width=5)
-                        ui.Button("Open", width=100, clicked_fn=self._open_sample_stage)
+                        self._stage_buttons.append(ui.Button("Open", width=100, clicked_fn=self._open_sample_stage))
                         ui.Spacer(width=10)
                         ui.Label("Open the sample dynamic stage in the Omniverse.")
@@ -10,11 +10,13 @@
 
 import asyncio
 import pathlib
+from functools import partial
 import carb
 import carb.settings
 import omni.ext
 import omni.kit
 import omni.kit.ui
+import omni.kit.clipboard
 import omni.ui as ui
 from omni.physxclashdetectionuicommon.windowmenuitem import MenuItem
 from .clash_detection_sample_window import ClashDetectionSamplesWindow
@@ -45,8 +47,8 @@ class ClashDetectionSamplesExtension(omni.ext.IExt):
         )
 
         def main_menu_click():
-            val = carb.settings.get_settings().get_as_bool(self.SETTING_CLASH_DETECTION_SAMPLES_WINDOW)
-            carb.settings.get_settings().set_bool(self.SETTING_CLASH_DETECTION_SAMPLES_WINDOW, not val)
+            val = self._settings.get_as_bool(self.SETTING_CLASH_DETECTION_SAMPLES_WINDOW)
+            self._settings.set_bool(self.SETTING_CLASH_DETECTION_SAMPLES_WINDOW, not val)
 
         self._menu = MenuItem(
             f"Physics/{self.MENU_ITEM_NAME}",
@@ -57,18 +59,18 @@ class ClashDetectionSamplesExtension(omni.ext.IExt):
 
         ui.Workspace.set_show_window_fn(ClashDetectionSamplesWindow.WINDOW_NAME, self.show_window)
 
-        async def sync_clash_samples_window_state_async():
+        async def deferred_startup_async():
+            app = omni.kit.app.get_app()
+            # sync clash samples window state after two updates
             for _ in range(2):
-                await omni.kit.app.get_app().next_update_async()
+                await app.next_update_async()
             if self._settings.get_as_bool(self.SETTING_CLASH_DETECTION_SAMPLES_WINDOW):
                 self._settings.set_bool(self.SETTING_CLASH_DETECTION_SAMPLES_WINDOW, True)
-        asyncio.ensure_future(sync_clash_samples_window_state_async())
-
-        async def show_eula_acceptance_window_async():
-            for _ in range(5):
-                await omni.kit.app.get_app().next_update_async()
+            # show EULA acceptance window after five updates
+            for _ in range(3):
+                await app.next_update_async()
             self._show_eula()
-        asyncio.ensure_future(show_eula_acceptance_window_async())
+        asyncio.ensure_future(deferred_startup_async())
 
     def _show_eula(self):
         """ EULA acceptance """
@@ -81,7 +83,7 @@ class ClashDetectionSamplesExtension(omni.ext.IExt):
                  "Do you accept the EULA (End User License Agreement)?"),
                 ok_button_text="Yes",
                 cancel_button_text="No",
-                ok_button_fn=lambda: self._settings.set_bool(self.OMNIVERSE_EULA_ACCEPTED, True),
+                ok_button_fn=partial(self._settings.set_bool, self.OMNIVERSE_EULA_ACCEPTED, True),
                 cancel_button_fn=omni.kit.app.get_app().post_quit,
                 on_closed_fn=omni.kit.app.get_app().post_quit,
                 modal=True,
@@ -90,7 +92,7 @@ class ClashDetectionSamplesExtension(omni.ext.IExt):
                     lambda: omni.ui.Button(
                         "Copy EULA URL to Clipboard",
                         width=712,
-                        clicked_fn=lambda: omni.kit.clipboard.copy(eula_url)
+                        clicked_fn=partial(omni.kit.clipboard.copy, eula_url)
                     )
                 ],
             ).show()
@@ -99,9 +101,9 @@ class ClashDetectionSamplesExtension(omni.ext.IExt):
         if event_type == carb.settings.ChangeEventType.CHANGED:
             enabled = self._settings.get_as_bool(self.SETTING_CLASH_DETECTION_SAMPLES_WINDOW)
             if not enabled:
+                # keep the window alive, so that showing it again does not need to rebuild it
                 if self._clash_samples_window:
-                    self._clash_samples_window.destroy()
-                    self._clash_samples_window = None
+                    self._clash_samples_window.visible = False
             else:
                 self.create_window()
 
@@ -114,10 +116,11 @@ class ClashDetectionSamplesExtension(omni.ext.IExt):
     def create_window(self):
         if self._clash_samples_window is None:
             self._clash_samples_window = ClashDetectionSamplesWindow(self._test_data_path)
-        # self._clash_samples_window.build_window()
-        if self._clash_samples_window:
             self._clash_samples_window.set_visibility_changed_fn(self._window_visibility_changed_fn)
+            # dock a new window only, a hidden one keeps its place when shown again
             self._clash_samples_window.deferred_dock_in("Content", ui.DockPolicy.CURRENT_WINDOW_IS_ACTIVE)
+        else:
+            self._clash_samples_window.visible = True
 
     def _window_visibility_changed_fn(self, visible):
         # handle the case when user closes the window by the top right cross
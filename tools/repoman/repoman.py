@@ -1,13 +1,11 @@
 import os
 import sys
-import io
 import contextlib
 import packmanapi
 
 
-REPO_ROOT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "../..")
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", ".."))
 REPO_DEPS_FILE = os.path.join(REPO_ROOT, "deps/repo-deps.packman.xml")
-print(REPO_DEPS_FILE)
 
 def bootstrap():
     """
@@ -15,12 +13,14 @@ def bootstrap():
 
     Pull with packman from repo.packman.xml and add them all to python sys.path to enable importing.
     """
-    with contextlib.redirect_stdout(io.StringIO()):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
         deps = packmanapi.pull(REPO_DEPS_FILE)
 
+    existing_paths = set(sys.path)
     for dep_path in deps.values():
-        if dep_path not in sys.path:
+        if dep_path not in existing_paths:
             sys.path.append(dep_path)
+            existing_paths.add(dep_path)
 
     # Add this repo root, as we are repoman itself!
     sys.path.append(REPO_ROOT)